@@ -56,11 +56,9 @@ def pre_procedure(client):
     )
 
     client.send(SetTool(fab_conf["tool"]["tool_name"].as_str()))
-    log.debug("Tool {} set.".format(fab_conf["tool"]["tool_name"].get()))
+    log.debug("Tool %s set.", fab_conf["tool"]["tool_name"].get())
     client.send(SetWorkObject(fab_conf["wobjs"]["placing_wobj_name"].as_str()))
-    log.debug(
-        "Work object {} set.".format(fab_conf["wobjs"]["placing_wobj_name"].get())
-    )
+    log.debug("Work object %s set.", fab_conf["wobjs"]["placing_wobj_name"].get())
 
     # Set Acceleration
     client.send(
@@ -138,6 +136,12 @@ def pick_bullet(client, picking_frame):
     picking_frame : :class:`compas.geometry.Frame`
         Target frame to pick up bullet
     """
+    # hoist conf lookups used more than once, they resolve to the same value
+    # on every send
+    speed_travel = fab_conf["movement"]["speed_travel"].as_number()
+    zone_travel = fab_conf["movement"]["zone_travel"].get(ZoneDataTemplate())
+    zone_pick = fab_conf["movement"]["zone_pick"].get(ZoneDataTemplate())
+
     # change work object before picking
     client.send(SetWorkObject(fab_conf["wobjs"]["picking_wobj_name"].get()))
 
@@ -149,21 +153,9 @@ def pick_bullet(client, picking_frame):
     # start watch
     client.send(StartWatch())
 
-    client.send(
-        MoveToFrame(
-            offset_picking,
-            fab_conf["movement"]["speed_travel"].as_number(),
-            fab_conf["movement"]["zone_travel"].get(ZoneDataTemplate()),
-        )
-    )
+    client.send(MoveToFrame(offset_picking, speed_travel, zone_travel))
 
-    client.send(
-        MoveToFrame(
-            picking_frame,
-            fab_conf["movement"]["speed_travel"].as_number(),
-            fab_conf["movement"]["zone_pick"].get(ZoneDataTemplate()),
-        )
-    )
+    client.send(MoveToFrame(picking_frame, speed_travel, zone_pick))
 
     grip_and_release(
         client,
@@ -177,7 +169,7 @@ def pick_bullet(client, picking_frame):
         MoveToFrame(
             offset_picking,
             fab_conf["movement"]["speed_picking"].as_number(),
-            fab_conf["movement"]["zone_pick"].get(ZoneDataTemplate()),
+            zone_pick,
         )
     )
 
@@ -205,16 +197,27 @@ def place_bullet(client, bullet):
         Object which blocks while waiting for feedback from robot. Calling result on
         this object will return the time the procedure took.
     """
-    log.debug("Location frame: {}".format(bullet.location))
+    log.debug("Location frame: %s", bullet.location)
+
+    # hoist conf lookups out of the trajectory loops, they resolve to the
+    # same value for every frame
+    speed_travel = fab_conf["movement"]["speed_travel"].as_number()
+    speed_placing = fab_conf["movement"]["speed_placing"].as_number()
+    zone_travel = fab_conf["movement"]["zone_travel"].get(ZoneDataTemplate())
+    zone_place = fab_conf["movement"]["zone_place"].get(ZoneDataTemplate())
 
     # change work object before placing
     client.send(SetWorkObject(fab_conf["wobjs"]["placing_wobj_name"].as_str()))
 
     # add offset placing plane to pre and post frames
 
+    # the offsets are both along the location frame's z axis, so the offset
+    # placement frame can be derived straight from location instead of
+    # transforming top_bullet_frame a second time
     top_bullet_frame = get_offset_frame(bullet.location, bullet.height)
     offset_placement = get_offset_frame(
-        top_bullet_frame, fab_conf["movement"]["offset_distance"].as_number()
+        bullet.location,
+        bullet.height + fab_conf["movement"]["offset_distance"].as_number(),
     )
 
     # start watch
@@ -222,28 +225,10 @@ def place_bullet(client, bullet):
 
     # Safe pos then vertical offset
     for frame in bullet.trajectory_to:
-        client.send(
-            MoveToFrame(
-                frame,
-                fab_conf["movement"]["speed_travel"].as_number(),
-                fab_conf["movement"]["zone_travel"].get(ZoneDataTemplate()),
-            )
-        )
+        client.send(MoveToFrame(frame, speed_travel, zone_travel))
 
-    client.send(
-        MoveToFrame(
-            offset_placement,
-            fab_conf["movement"]["speed_travel"].as_number(),
-            fab_conf["movement"]["zone_travel"].get(ZoneDataTemplate()),
-        )
-    )
-    client.send(
-        MoveToFrame(
-            top_bullet_frame,
-            fab_conf["movement"]["speed_placing"].as_number(),
-            fab_conf["movement"]["zone_place"].get(ZoneDataTemplate()),
-        )
-    )
+    client.send(MoveToFrame(offset_placement, speed_travel, zone_travel))
+    client.send(MoveToFrame(top_bullet_frame, speed_placing, zone_place))
 
     grip_and_release(
         client,
@@ -253,31 +238,13 @@ def place_bullet(client, bullet):
         wait_after=fab_conf["tool"]["wait_after_io"].get(),
     )
 
-    client.send(
-        MoveToFrame(
-            bullet.placement_frame,
-            fab_conf["movement"]["speed_placing"].as_number(),
-            fab_conf["movement"]["zone_place"].get(ZoneDataTemplate()),
-        )
-    )
+    client.send(MoveToFrame(bullet.placement_frame, speed_placing, zone_place))
 
-    client.send(
-        MoveToFrame(
-            offset_placement,
-            fab_conf["movement"]["speed_travel"].as_number(),
-            fab_conf["movement"]["zone_travel"].get(ZoneDataTemplate()),
-        )
-    )
+    client.send(MoveToFrame(offset_placement, speed_travel, zone_travel))
 
     # offset placement frame then safety frame
     for frame in bullet.trajectory_from:
-        client.send(
-            MoveToFrame(
-                frame,
-                fab_conf["movement"]["speed_travel"].as_number(),
-                fab_conf["movement"]["zone_travel"].get(ZoneDataTemplate()),
-            )
-        )
+        client.send(MoveToFrame(frame, speed_travel, zone_travel))
 
     client.send(StopWatch())
 
@@ -304,4 +271,4 @@ def grip_and_release(client, do_name, do_state, wait_before=1.0, wait_after=1.0)
     client.send(SetDigital(do_name, do_state))
     client.send(WaitTime(wait_after))
 
-    log.debug("IO {} set to {}.".format(do_name, do_state))
+    log.debug("IO %s set to %s.", do_name, do_state)
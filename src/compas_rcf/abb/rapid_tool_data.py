@@ -90,7 +90,7 @@ class RapidToolData(object):
         tcp_quaternion = tcp_frame.quaternion.wxyz
 
         if cog_pt:
-            kwargs.update({"cog_coord": cog_pt.data})
+            kwargs["cog_coord"] = cog_pt.data
 
         return cls(tcp_coord, tcp_quaternion, **kwargs)
 
@@ -118,8 +118,7 @@ class RapidToolData(object):
         tcp_quaternion = tcp_frame.quaternion.wxyz
 
         if cog_pt:
-            cog_coord = [cog_pt.X, cog_pt.Y, cog_pt.Z]
-            kwargs.update({"cog_coord": cog_coord})
+            kwargs["cog_coord"] = [cog_pt.X, cog_pt.Y, cog_pt.Z]
 
         return cls(tcp_coord, tcp_quaternion, **kwargs)
 
@@ -131,23 +130,9 @@ class RapidToolData(object):
         :class:`str`
         """
         data = self.tcp_coord + self.tcp_quaternion + [self.weight] + self.cog_coord
-        formatted_data = [self._float_str(x) for x in data]
 
-        return self.RAPID_TOOLDATA_FORMAT.format(self.name, *formatted_data)
-
-    def _float_str(self, n):
-        """Format float as string with given tolerance.
-
-        Arguments
-        ---------
-        n : :class:`float` or :class:`int`
-            Number to format
+        # Get tolerance as number of decimals, same for every value
+        tol = int(-1 * math.floor(math.log(self.tolerance, 10)))
+        formatted_data = ["{:.{tol}f}".format(float(n), tol=tol) for n in data]
 
-        Returns
-        -------
-        :class:`str`
-        """
-        # Get tolerance as number of decimals
-        tol = -1 * math.floor(math.log(self.tolerance, 10))
-
-        return "{:.{tol}f}".format(float(n), tol=int(tol))
+        return self.RAPID_TOOLDATA_FORMAT.format(self.name, *formatted_data)
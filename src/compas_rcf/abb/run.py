@@ -6,13 +6,17 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import atexit
 import json
 import logging as log
+import os
 import pathlib
+import queue
 import sys
 import time
 from datetime import datetime
-from operator import attrgetter
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from pathlib import Path
 
 from compas_fab.backends.ros import RosClient
@@ -31,6 +35,7 @@ from compas_rcf.abb import pre_procedure
 from compas_rcf.docker import compose_up
 from compas_rcf.fab_data import ClayBulletEncoder
 from compas_rcf.fab_data import PickStation
+from compas_rcf.fab_data import dump_bullets
 from compas_rcf.fab_data import fab_conf
 from compas_rcf.fab_data import load_bullets
 from compas_rcf.fab_data.conf import ABB_RCF_CONF_TEMPLATE
@@ -53,10 +58,20 @@ def logging_setup(args, log_dir):
     if not args.quiet:
         handlers.append(log.StreamHandler(sys.stdout))
 
+    formatter = log.Formatter("%(asctime)s:%(levelname)s:%(funcName)s:%(message)s")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Handlers write on a background thread so that file and console IO
+    # doesn't block the thread sending robot instructions
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+
     log.basicConfig(
         level=log.DEBUG if args.debug else log.INFO,
-        format="%(asctime)s:%(levelname)s:%(funcName)s:%(message)s",
-        handlers=handlers,
+        handlers=[QueueHandler(log_queue)],
     )
 
 
@@ -73,18 +88,21 @@ def setup_fab_data(clay_bullets):
     list of :class:`compas_rcf.fabrication.clay_objs.ClayBullet`
         Curated list of ClayBullets
     """
-    maybe_placed = [bullet for bullet in clay_bullets if bullet.placed is not None]
+    maybe_placed_idx = [
+        i for i, bullet in enumerate(clay_bullets) if bullet.placed is not None
+    ]
 
-    if len(maybe_placed) < 1:
+    if len(maybe_placed_idx) < 1:
         return clay_bullets
 
-    last_placed = max(maybe_placed, key=attrgetter("bullet_id"))
-    last_placed_index = clay_bullets.index(last_placed)
+    last_placed_index = max(maybe_placed_idx, key=lambda i: clay_bullets[i].bullet_id)
+    last_placed = clay_bullets[last_placed_index]
 
     log.info(
-        "Last bullet placed was {:03}/{:03} with id {}.".format(
-            last_placed_index, len(clay_bullets), last_placed.bullet_id
-        )
+        "Last bullet placed was %03d/%03d with id %s.",
+        last_placed_index,
+        len(clay_bullets),
+        last_placed.bullet_id,
     )
 
     skip_options = questionary.select(
@@ -98,7 +116,12 @@ def setup_fab_data(clay_bullets):
     ).ask()
 
     if skip_options == "Skip all bullet marked as placed in JSON file.":
-        to_place = [bullet for bullet in clay_bullets if bullet not in maybe_placed]
+        maybe_placed_set = set(maybe_placed_idx)
+        to_place = [
+            bullet
+            for i, bullet in enumerate(clay_bullets)
+            if i not in maybe_placed_set
+        ]
     if skip_options == "Place all anyways.":
         to_place = clay_bullets[:]
     if skip_options == "Place some of the bullets.":
@@ -114,17 +137,18 @@ def setup_fab_data(clay_bullets):
             ).ask()
             to_place = clay_bullets[last_placed_index - int(n_place_again) + 1 :]
             log.info(
-                "Placing last {} bullets again. First bullet will be id {}.".format(
-                    n_place_again, to_place[0].bullet_id,
-                )
+                "Placing last %s bullets again. First bullet will be id %s.",
+                n_place_again,
+                to_place[0].bullet_id,
             )
         else:
+            # bind the format method once instead of re-parsing the format
+            # string for every bullet
+            fmt = "{:03} (id {}), marked placed: {}".format
             to_place_selection = questionary.checkbox(
                 "Select bullets:",
                 [
-                    "{:03} (id {}), marked placed: {}".format(
-                        i, bullet.bullet_id, bullet.placed is not None
-                    )
+                    fmt(i, bullet.bullet_id, bullet.placed is not None)
                     for i, bullet in enumerate(clay_bullets)
                 ],
             ).ask()
@@ -152,8 +176,8 @@ def main():
     fab_json_path = fab_conf["paths"]["fab_data_path"].as_path()
     clay_bullets = load_bullets(fab_json_path)
 
-    log.info("Fabrication data read from: {}".format(fab_json_path))
-    log.info("{} items in clay_bullets.".format(len(clay_bullets)))
+    log.info("Fabrication data read from: %s", fab_json_path)
+    log.info("%d items in clay_bullets.", len(clay_bullets))
 
     pick_station_json = fab_conf["paths"]["pick_conf_path"].as_path()
     with pick_station_json.open(mode="r") as fp:
@@ -182,7 +206,10 @@ def main():
     ############################################################################
     # setup in_progress JSON                                                   #
     ############################################################################
-    if not fab_conf["skip_progress_file"]:
+    # conf value is constant for the whole run, resolve it once
+    skip_progress_file = fab_conf["skip_progress_file"].get()
+
+    if not skip_progress_file:
         json_progress_identifier = "IN_PROGRESS-"
 
         if fab_json_path.name.startswith(json_progress_identifier):
@@ -192,11 +219,39 @@ def main():
                 json_progress_identifier + fab_json_path.name
             )
 
+        # Companion file that placed bullets are appended to one JSON object
+        # per line, to avoid redumping the full list every cycle
+        progress_jsonl = in_progress_json.with_suffix(".jsonl")
+
+        # A crash during an earlier run skips the shutdown dump, so the
+        # placed state only survives in the companion file. Merge it back
+        # onto the bullets before setup_fab_data checks for placed bullets.
+        if progress_jsonl.exists():
+            with progress_jsonl.open(mode="r") as fp:
+                placed_data = {}
+                for line in fp:
+                    if line.strip():
+                        data = json.loads(line)
+                        placed_data[data["bullet_id"]] = data
+
+            for bullet in clay_bullets:
+                data = placed_data.get(bullet.bullet_id)
+                if data is not None and bullet.placed is None:
+                    bullet.placed = data.get("placed")
+                    bullet.cycle_time = data.get("cycle_time")
+
+            log.info(
+                "Resumed placed state for %d bullets from %s",
+                len(placed_data),
+                progress_jsonl.name,
+            )
+
     ############################################################################
     # Fabrication loop                                                         #
     ############################################################################
 
     to_place = setup_fab_data(clay_bullets)
+    n_bullets = len(to_place)
 
     if not questionary.confirm("Ready to start program?").ask():
         log.critical("Program exited because user didn't confirm start.")
@@ -210,9 +265,15 @@ def main():
         bullet.placed = None
         bullet.cycle_time = None
 
+    # Keep progress file open for the whole run, bullets are appended as they
+    # are placed
+    progress_fp = None
+    if not skip_progress_file:
+        progress_fp = progress_jsonl.open(mode="a")
+
     for i, bullet in enumerate(to_place):
         current_bullet_desc = "Bullet {:03}/{:03} with id {}.".format(
-            i, len(to_place) - 1, bullet.bullet_id
+            i, n_bullets - 1, bullet.bullet_id
         )
 
         abb.send(PrintText(current_bullet_desc))
@@ -229,50 +290,61 @@ def main():
         bullet.placed = 1  # set placed to temporary value to mark it as "placed"
 
         # Write progress to json while waiting for robot
-        if not fab_conf["skip_progress_file"].get():
-            with in_progress_json.open(mode="w") as fp:
-                json.dump(clay_bullets, fp, cls=ClayBulletEncoder)
-            log.debug("Wrote clay_bullets to {}".format(in_progress_json.name))
+        if progress_fp:
+            progress_fp.write(json.dumps(bullet, cls=ClayBulletEncoder) + "\n")
+            progress_fp.flush()
+            log.debug("Appended placed bullet to %s", progress_jsonl.name)
 
         # This blocks until cycle is finished
         cycle_time = pick_future.result() + place_future.result()
 
         bullet.cycle_time = cycle_time
-        log.debug("Cycle time was {}".format(bullet.cycle_time))
+        log.debug("Cycle time was %s", bullet.cycle_time)
         bullet.placed = time.time()
-        log.debug("Time placed was {}".format(bullet.placed))
+        log.debug("Time placed was %s", bullet.placed)
+
+        # Append a second, completed record with the real timestamp and cycle
+        # time, the resume merge takes the last line per bullet_id
+        if progress_fp:
+            progress_fp.write(json.dumps(bullet, cls=ClayBulletEncoder) + "\n")
+            progress_fp.flush()
 
     ############################################################################
     # Shutdown procedure                                                       #
     ############################################################################
 
+    if progress_fp:
+        progress_fp.close()
+
     # Write progress of last run of loop
-    if not fab_conf["skip_progress_file"].get():
-        with in_progress_json.open(mode="w") as fp:
-            json.dump(clay_bullets, fp, cls=ClayBulletEncoder)
-        log.debug("Wrote clay_bullets to {}".format(in_progress_json.name))
-
-    if (
-        len([bullet for bullet in clay_bullets if bullet.placed is None]) == 0
-        and not fab_conf["skip_progress_file"].get()
-    ):
-        done_file_name = fab_json_path.name.replace(json_progress_identifier, "")
-        done_json = fab_conf["paths"]["json_dir"].as_path() / "00_done" / done_file_name
-
-        in_progress_json.rename(done_json)
-
-        with done_json.open(mode="w") as fp:
-            json.dump(clay_bullets, fp, cls=ClayBulletEncoder)
-
-        log.debug("Saved placed bullets to 00_Done.")
-    elif not fab_conf["skip_progress_file"].get():
-        log.debug(
-            "Bullets without placed timestamp still present, keeping {}".format(
-                in_progress_json.name
+    if not skip_progress_file:
+        if all(bullet.placed is not None for bullet in clay_bullets):
+            done_file_name = fab_json_path.name.replace(json_progress_identifier, "")
+            done_json = (
+                fab_conf["paths"]["json_dir"].as_path() / "00_done" / done_file_name
+            )
+
+            # dump to a temporary file and move it in place atomically, so an
+            # interrupted write can't leave a truncated done file. The temp
+            # name keeps the extension since dump_bullets dispatches on it.
+            tmp_json = done_json.parent / ("tmp-" + done_json.name)
+            dump_bullets(clay_bullets, tmp_json)
+            os.replace(str(tmp_json), str(done_json))
+
+            if in_progress_json.exists():
+                in_progress_json.unlink()
+            if progress_jsonl.exists():
+                progress_jsonl.unlink()
+
+            log.debug("Saved placed bullets to 00_Done.")
+        else:
+            dump_bullets(clay_bullets, in_progress_json)
+            log.debug(
+                "Bullets without placed timestamp still present, wrote %s",
+                in_progress_json.name,
             )
-        )
 
-    log.info("Finished program with {} bullets.".format(len(to_place)))
+    log.info("Finished program with %d bullets.", n_bullets)
 
     post_procedure(abb)
 
@@ -326,7 +398,7 @@ if __name__ == "__main__":
     fab_conf.set_args(args, dots=True)
 
     # Read conf file specified in run_data
-    log.info("Configuration loaded from {}".format(run_data["conf_path"]))
+    log.info("Configuration loaded from %s", run_data["conf_path"])
     fab_conf.set_file(run_data["conf_path"])
 
     # Add paths from run_data to fab_conf
@@ -340,9 +412,9 @@ if __name__ == "__main__":
     # Validate conf
     fab_conf.get(ABB_RCF_CONF_TEMPLATE)
 
-    log.info("compas_rcf version: {}".format(__version__))
-    log.info("Target is {} controller.".format(fab_conf["target"].get().upper()))
-    log.debug("argparse input: {}".format(args))
-    log.debug("config after set_args: {}".format(fab_conf))
+    log.info("compas_rcf version: %s", __version__)
+    log.info("Target is %s controller.", fab_conf["target"].get().upper())
+    log.debug("argparse input: %s", args)
+    log.debug("config after set_args: %s", fab_conf)
 
     main()
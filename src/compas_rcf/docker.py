@@ -28,17 +28,6 @@ import sys
 log = logging.getLogger(__name__)
 
 
-def _setup_env_vars(env_vars):
-    list_vars = []
-    for key in env_vars:
-        if os.name == "nt":
-            list_vars.append("set")
-        list_vars.append("{}={}".format(key.upper(), env_vars[key]))
-        list_vars.append("&&")
-
-    return list_vars
-
-
 def _run(cmd, check_output=False, print_output=True, **kwargs):
     if sys.version_info.major < 3:
         subprocess.call(cmd, universal_newlines=print_output, **kwargs)
@@ -89,20 +78,26 @@ def compose_up(
         Environment variables to set before running ``docker-compose``
     """
     run_kwargs = {}
-    run_kwargs.update({"check_output": check_output})
-    run_kwargs.update({"print_output": print_output})
+    run_kwargs["check_output"] = check_output
+    run_kwargs["print_output"] = print_output
 
     cmd_str = 'docker-compose --file "{}" up --detach'.format(path)
     cmd = shlex.split(cmd_str)
 
     log.debug("Env vars: {}".format(env_vars))
 
-    if ignore_orphans:
-        env_vars.update({"COMPOSE_IGNORE_ORPHANS": "true"})
+    if ignore_orphans or len(env_vars) > 0:
+        # pass env vars through the subprocess environment rather than
+        # prefixing the command with shell specific set statements
+        env = os.environ.copy()
+
+        if ignore_orphans:
+            env["COMPOSE_IGNORE_ORPHANS"] = "true"
+
+        for key in env_vars:
+            env[key.upper()] = str(env_vars[key])
 
-    if len(env_vars) > 0:
-        cmd = _setup_env_vars(env_vars) + cmd
-        run_kwargs.update({"shell": True})
+        run_kwargs["env"] = env
 
     if force_recreate:
         cmd.append("--force-recreate")
@@ -40,6 +40,7 @@ Tools & Utilities
 
     csv_reports
     load_bullets
+    dump_bullets
     ClayBulletEncoder
     check_id_collision
 """
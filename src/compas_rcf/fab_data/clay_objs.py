@@ -3,10 +3,14 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import collections
 import math
 from itertools import count
 
+try:
+    from collections.abc import Sequence
+except ImportError:  # Python 2 and IronPython
+    from collections import Sequence
+
 from compas import IPY
 from compas.datastructures import Mesh as cg_Mesh
 from compas.datastructures import Network
@@ -135,7 +139,7 @@ class ClayBullet(object):
         """Ensure trajectory_to elements are :class:`compas.geometry.Frame` objects."""
         self._trajectory_to = []
 
-        if isinstance(frame_list, collections.Sequence):
+        if isinstance(frame_list, Sequence):
             for frame_like in frame_list:
                 frame = ensure_frame(frame_like)
                 self._trajectory_to.append(frame)
@@ -157,7 +161,7 @@ class ClayBullet(object):
     def trajectory_from(self, frame_list):
         """Ensure trajectory_from elements are :class:`compas.geometry.Frame` objects."""  # noqa: E501
         self._trajectory_from = []
-        if isinstance(frame_list, collections.Sequence):
+        if isinstance(frame_list, Sequence):
             for frame_like in frame_list:
                 frame = ensure_frame(frame_like)
                 self._trajectory_from.append(frame)
@@ -346,13 +350,13 @@ class ClayBullet(object):
         """
         location = Frame.from_data(data.pop("_location"))
 
-        trajectory_to = []
-        for frame_data in data.pop("_trajectory_to"):
-            trajectory_to.append(Frame.from_data(frame_data))
+        trajectory_to = [
+            Frame.from_data(frame_data) for frame_data in data.pop("_trajectory_to")
+        ]
 
-        trajectory_from = []
-        for frame_data in data.pop("_trajectory_from"):
-            trajectory_from.append(Frame.from_data(frame_data))
+        trajectory_from = [
+            Frame.from_data(frame_data) for frame_data in data.pop("_trajectory_from")
+        ]
 
         # To check for old attr name for id
         if "bullet_id" in data.keys():
@@ -493,10 +497,8 @@ def check_id_collision(clay_bullets):
     Exception
         Raises exception when first duplicate is found
     """
-    ids = [bullet.id for bullet in clay_bullets]
-
     set_of_ids = set()
-    for id in ids:
+    for id in (bullet.id for bullet in clay_bullets):
         if id in set_of_ids:
             raise Exception(
                 "Id {} appears more than once in list of ClayBullet instances".format(
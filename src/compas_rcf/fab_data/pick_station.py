@@ -27,6 +27,10 @@ class PickStation(object):
         self.counter = 0
         self.n_pick_frames = len(pick_frames)
 
+        # Pick frames are static and bullet heights mostly uniform, so the
+        # computed offset frames can be cached per frame index and height
+        self._offset_frames = {}
+
     def get_next_frame(self, bullet):
         """Get next frame to pick bullet at.
 
@@ -42,16 +46,19 @@ class PickStation(object):
         idx = self.counter % self.n_pick_frames
         self.counter += 1
 
-        log.debug("Counter at: {}, Frame index at {}".format(self.counter, idx))
-
-        location_frame = self.pick_frames[idx]
+        log.debug("Counter at: %d, Frame index at %d", self.counter, idx)
 
         pick_height = bullet.height * (
             1 - fab_conf["movement"]["compress_at_pick"].get()
         )
-        frame = get_offset_frame(location_frame, pick_height)
 
-        log.debug("Pick frames: {}".format(frame))
+        key = (idx, pick_height)
+        frame = self._offset_frames.get(key)
+        if frame is None:
+            frame = get_offset_frame(self.pick_frames[idx], pick_height)
+            self._offset_frames[key] = frame
+
+        log.debug("Pick frames: %s", frame)
 
         return frame
 
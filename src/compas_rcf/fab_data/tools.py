@@ -19,7 +19,17 @@ except ImportError:
     except ImportError:
         pass
 
-__all__ = ["csv_reports", "ClayBulletEncoder", "load_bullets"]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+__all__ = ["csv_reports", "ClayBulletEncoder", "load_bullets", "dump_bullets"]
 
 
 def csv_reports(args):
@@ -67,6 +77,8 @@ def csv_reports(args):
             "weight (kg)",
         ]
 
+        pt_fmt = ",".join(["{:.3f}"] * 3)
+
         with csv_file.open(mode="w", encoding="utf8", newline="") as out_file:
             csv_w = csv.writer(out_file)
             csv_w.writerow(columns)
@@ -102,7 +114,6 @@ def csv_reports(args):
                 else:
                     row.append(None)
 
-                pt_fmt = ",".join(["{:.3f}"] * 3)
                 row.append(pt_fmt.format(*bullet.location.point))
 
                 row.append(bullet.tool)
@@ -131,22 +142,55 @@ class ClayBulletEncoder(json.JSONEncoder):
 
 
 def load_bullets(file_path):
-    """Load fabrication data from JSON file.
+    """Load fabrication data from file.
+
+    The file format is selected based on the file extension, ``.msgpack``
+    files are decoded using :mod:`msgpack`, everything else is treated as
+    JSON.
 
     Parameters
     ----------
     file_path : :class:`os.PathLike` or :class:`str`
-        JSON file to load data from.
+        File to load data from.
 
     Returns
     -------
     :class:`list` of :class:`ClayBullet`
     """
-    with open(str(file_path), mode="r") as fp:
-        json_string = json.load(fp)
+    if Path(str(file_path)).suffix == ".msgpack":
+        if msgpack is None:
+            raise ImportError("Package msgpack is required to load .msgpack files.")
+        with open(str(file_path), mode="rb") as fp:
+            data = msgpack.unpackb(fp.read(), raw=False)
+    else:
+        with open(str(file_path), mode="r") as fp:
+            data = json.load(fp)
 
-    clay_bullets = []
-    for dict_ in json_string:
-        clay_bullets.append(ClayBullet.from_data(dict_))
+    return [ClayBullet.from_data(dict_) for dict_ in data]
 
-    return clay_bullets
+
+def dump_bullets(clay_bullets, file_path):
+    """Dump fabrication data to file.
+
+    ``.msgpack`` files are encoded using :mod:`msgpack`, everything else is
+    written as JSON, using :mod:`orjson` if it's installed with a fallback to
+    :mod:`json` from the standard library.
+
+    Parameters
+    ----------
+    clay_bullets : :class:`list` of :class:`ClayBullet`
+        Fabrication data to dump.
+    file_path : :class:`os.PathLike` or :class:`str`
+        File to write data to.
+    """
+    if Path(str(file_path)).suffix == ".msgpack":
+        if msgpack is None:
+            raise ImportError("Package msgpack is required to write .msgpack files.")
+        with open(str(file_path), mode="wb") as fp:
+            fp.write(msgpack.packb(clay_bullets, default=ClayBulletEncoder().default))
+    elif orjson is not None:
+        with open(str(file_path), mode="wb") as fp:
+            fp.write(orjson.dumps(clay_bullets, default=ClayBulletEncoder().default))
+    else:
+        with open(str(file_path), mode="w") as fp:
+            json.dump(clay_bullets, fp, cls=ClayBulletEncoder, check_circular=False)
@@ -8,9 +8,6 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from tkinter import Tk
-from tkinter.filedialog import askopenfilename
-
 try:
     from pathlib import Path
 except ImportError:
@@ -19,6 +16,29 @@ except ImportError:
     except ImportError:
         pass
 
+_tk_root = None
+
+
+def _get_tk_root():
+    """Create hidden Tk root window on first use, reuse it on later calls.
+
+    Keeps :any:`tkinter` and its embedded Tcl interpreter out of module
+    import, so headless use of :mod:`compas_rcf` doesn't pay for it.
+
+    Returns
+    -------
+    :class:`tkinter.Tk`
+    """
+    global _tk_root
+
+    if _tk_root is None:
+        from tkinter import Tk
+
+        _tk_root = Tk()
+        _tk_root.withdraw()
+
+    return _tk_root
+
 
 def open_file_dialog(
     title="Select file",
@@ -46,8 +66,9 @@ def open_file_dialog(
     -------
     :class:`str` or :class:`pathlib.Path`
     """
-    root = Tk()
-    root.withdraw()
+    from tkinter.filedialog import askopenfilename
+
+    _get_tk_root()
 
     filename = askopenfilename(
         initialdir=str(initial_dir),